@@ -13,6 +13,28 @@ from xml.etree import ElementTree
 
 from six import add_metaclass
 
+# MAPPINGS of each type, resolved once with their default values. See _get_xml_mappings
+_COMPILED_XML_MAPPINGS = {}
+
+
+def _get_xml_mappings(obj_type):
+    """
+    Get the MAPPINGS of the given type in a form that does not require any further lookup when parsing.
+
+    The result is computed on first use and cached, since MAPPINGS are static class attributes.
+
+    :param obj_type: type of the object to map the xml into
+    :return: a dict that maps each xml tag to a (field, transformation, is_xml_elem) tuple
+    """
+    mappings = _COMPILED_XML_MAPPINGS.get(obj_type)
+    if mappings is None:
+        mappings = {
+            tag: (mapping["field"], mapping.get("transformation"), mapping.get("xml_elem_type", "text") == "xml")
+            for tag, mapping in obj_type.MAPPINGS.items()
+        }
+        _COMPILED_XML_MAPPINGS[obj_type] = mappings
+    return mappings
+
 
 def from_xml_to_obj(xml, obj_type):
     """
@@ -21,34 +43,38 @@ def from_xml_to_obj(xml, obj_type):
     The python object you want to map the xml into needs to define a MAPPINGS dictionary which declare how
     to map each tag of the xml doc into the object itself.
     Each entry of the MAPPINGS dictionary is composed as follow:
-    - key: name of the xml tag to map
+    - key: name of the xml tag to map. Only the direct children of the root element are mapped.
     - value: a dict containing:
         - field: name of the object attribute you want to map the value to
         - transformation: a function that will be called on the value before assigning this to the object attribute.
         - xml_elem_type: how to interpret the tag content. values: {text, xml}, defaults to text
     Default values can be defined in the class __init__ definition.
 
-    :param xml: string containing the xml doc to parse
+    :param xml: the xml doc to parse, either as str or bytes, or an already parsed xml element
     :param obj_type: type of the object you want to map the xml into
     :return: an instance of obj_type containing the xml data
     """
     obj = obj_type()
-    root = ElementTree.fromstring(xml)
-    for tag, mapping in obj_type.MAPPINGS.items():
-        results = root.findall(tag)
-        transformation_func = mapping.get("transformation")
-        xml_elem_type = mapping.get("xml_elem_type", "text")
-        values = []
-        for result in results:
-            if xml_elem_type == "xml":
-                input = result
-            else:
-                input = result.text
-                if input:
-                    input = input.strip()
-            values.append(input if transformation_func is None else transformation_func(input))
-        if values:
-            setattr(obj, mapping["field"], values[0] if len(values) == 1 else values)
+    # parsed elements are mapped in place to avoid serializing and parsing them again
+    root = xml if ElementTree.iselement(xml) else ElementTree.fromstring(xml)
+    mappings = _get_xml_mappings(obj_type)
+    values = {}
+    # single pass over the child elements, dispatching each of them on its tag
+    for element in root:
+        mapping = mappings.get(element.tag)
+        if mapping is None:
+            continue
+        field, transformation_func, is_xml_elem = mapping
+        if is_xml_elem:
+            input = element
+        else:
+            input = element.text
+            if input:
+                input = input.strip()
+        values.setdefault(field, []).append(input if transformation_func is None else transformation_func(input))
+
+    for field, field_values in values.items():
+        setattr(obj, field, field_values[0] if len(field_values) == 1 else field_values)
 
     return obj
 
@@ -75,31 +101,68 @@ def from_table_to_obj_list(table, obj_type, separator="|"):
     results = []
     if len(lines) > 1:
         mappings = obj_type.MAPPINGS
-        columns = lines[0].split(separator)
+        # resolve once the position, field and transformation of every mapped column
+        schedule = []
+        for index, column in enumerate(lines[0].split(separator)):
+            mapping = mappings.get(column)
+            if mapping:
+                schedule.append((index, mapping["field"], mapping.get("transformation")))
+
         rows = lines[1:]
         for row in rows:
             obj = obj_type()
-            for item, column in zip(row.split(separator), columns):
-                mapping = mappings.get(column)
-                if mapping:
-                    transformation_func = mapping.get("transformation")
-                    value = item if transformation_func is None else transformation_func(item)
-                    setattr(obj, mapping["field"], value)
+            items = row.split(separator)
+            items_count = len(items)
+            for index, field, transformation_func in schedule:
+                if index >= items_count:
+                    # schedule is sorted by index, hence all the remaining columns are missing as well
+                    break
+                item = items[index]
+                setattr(obj, field, item if transformation_func is None else transformation_func(item))
             results.append(obj)
 
     return results
 
 
+def _get_slots(obj_type):
+    """
+    Get the names of the slots declared by obj_type and by its base classes.
+
+    self.__slots__ only returns the slots of the most derived class declaring them, hence the whole MRO is walked,
+    base classes first.
+    """
+    slots = []
+    for cls in reversed(obj_type.__mro__):
+        cls_slots = cls.__dict__.get("__slots__", ())
+        if isinstance(cls_slots, str):
+            cls_slots = (cls_slots,)
+        for name in cls_slots:
+            if name not in slots and name not in ("__dict__", "__weakref__"):
+                slots.append(name)
+    return slots
+
+
 @add_metaclass(ABCMeta)
 class ComparableObject:
+    # Subclasses are expected to declare all their attributes in __slots__, since these objects are created in bulk
+    # for every job and host returned by the scheduler. Subclasses without __slots__ store them in __dict__ instead.
+    __slots__ = ()
+
+    def _get_attributes(self):
+        attributes = [(name, getattr(self, name)) for name in _get_slots(type(self)) if hasattr(self, name)]
+        # __dict__ is sorted since its order is not preserved before Python 3.6
+        attributes.extend(sorted(getattr(self, "__dict__", {}).items()))
+        return attributes
+
     def __eq__(self, other):
         if type(other) is type(self):
-            return self.__dict__ == other.__dict__
+            return self._get_attributes() == other._get_attributes()
         return False
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
     def __repr__(self):
-        attrs = ", ".join(["{key}={value}".format(key=key, value=repr(value)) for key, value in self.__dict__.items()])
-        return "{class_name}({attrs})".format(class_name=self.__class__.__name__, attrs=attrs)
+        # printf-style formatting is cheaper than str.format, while f-strings would require Python >= 3.6
+        attrs = ", ".join(["%s=%r" % attribute for attribute in self._get_attributes()])
+        return "%s(%s)" % (self.__class__.__name__, attrs)
@@ -56,7 +56,8 @@ QCONF_COMMANDS = {
 # or some combination thereof.
 # Refer to qstat man page for additional details.
 # o(rphaned) is not considered as busy since we assume a node in orphaned state is not present in ASG anymore
-SGE_BUSY_STATES = ["u", "C", "s", "D", "E", "P"]
+# States are single letter flags, hence a queue state string can be checked against the set with a single scan.
+SGE_BUSY_STATES = frozenset(["u", "C", "s", "D", "E", "P"])
 
 # This state is set by nodewatcher when the node is locked and is being terminated.
 SGE_DISABLED_STATE = "d"
@@ -79,7 +80,8 @@ SGE_HOLD_STATE = "h"
 # by the current cluster queue configuration or the host group configuration. The queue instance is kept because jobs
 # which have not yet finished are still associated with it, and it will vanish from qstat output when these jobs have
 # finished.
-SGE_ERROR_STATES = ["u", "E", "o"]
+# As for SGE_BUSY_STATES, the set of single letter flags allows to check a queue state string with a single scan.
+SGE_ERROR_STATES = frozenset(["u", "E", "o"])
 
 
 def exec_qconf_command(hosts, qhost_command):
@@ -192,7 +194,7 @@ def get_compute_nodes_info(hostname_filter=None, job_state_filter=None):
 
     root = ElementTree.fromstring(output)
     queue_info = root.findall("./queue_info/*")
-    hosts_list = [SgeHost.from_xml(ElementTree.tostring(host)) for host in queue_info]
+    hosts_list = [SgeHost.from_xml(host) for host in queue_info]
     return dict((host.name, host) for host in hosts_list)
 
 
@@ -203,7 +205,7 @@ def get_jobs_info(hostname_filter=None, job_state_filter=None):
 
     root = ElementTree.fromstring(output)
     job_info = root.findall(".//job_list")
-    return [SgeJob.from_xml(ElementTree.tostring(host)) for host in job_info]
+    return [SgeJob.from_xml(host) for host in job_info]
 
 
 def get_pending_jobs_info(max_slots_filter=None, skip_if_state=None):
@@ -255,6 +257,8 @@ class SgeJob(ComparableObject):
         "queue_name": {"field": "hostname", "transformation": lambda name: name.split("@", 1)[1] if name else None},
     }
 
+    __slots__ = ("number", "slots", "state", "node_type", "array_index", "hostname")
+
     def __init__(self, number=None, slots=0, state="", node_type=None, array_index=None, hostname=None):
         self.number = number
         self.slots = slots
@@ -305,11 +309,13 @@ class SgeHost(ComparableObject):
         "state": {"field": "state"},
         "job_list": {
             "field": "jobs",
-            "transformation": lambda job: SgeJob.from_xml(ElementTree.tostring(job)),
+            "transformation": lambda job: SgeJob.from_xml(job),
             "xml_elem_type": "xml",
         },
     }
 
+    __slots__ = ("name", "slots_total", "slots_used", "slots_reserved", "state", "jobs")
+
     def __init__(self, name=None, slots_total=0, slots_used=0, slots_reserved=0, state="", jobs=None):
         self.name = name
         self.slots_total = slots_total
@@ -134,6 +134,8 @@ class SlurmJob(ComparableObject):
         "REASON": {"field": "pending_reason"},
     }
 
+    __slots__ = ("id", "state", "nodes", "cpus_total", "cpus_min_per_node", "pending_reason")
+
     def __init__(self, id=None, state="", nodes=0, cpus_total=0, cpus_min_per_node=0, pending_reason=""):
         self.id = id
         self.state = state
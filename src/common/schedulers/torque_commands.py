@@ -162,7 +162,7 @@ def get_compute_nodes_info(hostname_filter=None):
     if output.startswith("<Data>"):
         root = ElementTree.fromstring(output)
         nodes = root.findall("./Node")
-        nodes_list = [TorqueHost.from_xml(ElementTree.tostring(node)) for node in nodes]
+        nodes_list = [TorqueHost.from_xml(node) for node in nodes]
         return dict((node.name, node) for node in nodes_list if node.note != "MasterServer")
     else:
         if output != "":
@@ -188,7 +188,7 @@ def get_jobs_info(filter_by_states=None, filter_by_exec_hosts=None):
     jobs = root.findall("./Job")
     jobs_list = []
     for job in jobs:
-        parsed_job = TorqueJob.from_xml(ElementTree.tostring(job))
+        parsed_job = TorqueJob.from_xml(job)
         if filter_by_states and parsed_job.state not in filter_by_states:
             continue
         if filter_by_exec_hosts:
@@ -243,6 +243,8 @@ class TorqueHost(ComparableObject):
         "note": {"field": "note"},
     }
 
+    __slots__ = ("name", "slots", "state", "jobs", "note")
+
     def __init__(self, name=None, slots=0, state="", jobs=None, note=""):
         self.name = name
         self.slots = slots
@@ -305,7 +307,7 @@ class TorqueJob(ComparableObject):
         "job_state": {"field": "state"},
         "Resource_List": {
             "field": "resources_list",
-            "transformation": lambda res: TorqueResourceList.from_xml(ElementTree.tostring(res)),
+            "transformation": lambda res: TorqueResourceList.from_xml(res),
             "xml_elem_type": "xml",
         },
         "exec_host": {
@@ -314,6 +316,8 @@ class TorqueJob(ComparableObject):
         },
     }
 
+    __slots__ = ("id", "state", "resources_list", "exec_hosts")
+
     def __init__(self, id=None, state=None, resources_list=None, exec_hosts=None):
         self.id = id
         self.state = state
@@ -348,6 +352,8 @@ class TorqueResourceList(ComparableObject):
         "ncpus": {"field": "ncpus", "transformation": int},
     }
 
+    __slots__ = ("nodes_resources", "nodes_count", "ncpus")
+
     def __init__(self, nodes_resources=None, nodes_count=None, ncpus=None):
         self.nodes_resources = nodes_resources
         self.nodes_count = nodes_count
@@ -18,27 +18,37 @@ from common.schedulers.sge_commands import (
     get_compute_nodes_info,
     get_pending_jobs_info,
 )
+from jobwatcher.plugins.utils import get_optimal_nodes
 
 log = logging.getLogger(__name__)
 
 
-def _get_required_slots(instance_properties, max_size):
-    """Compute the total number of slots required by pending jobs."""
-    max_cluster_slots = max_size * instance_properties.get("slots")
+def _get_required_slots(vcpus, max_size):
+    """Compute the slots required by each pending job."""
+    max_cluster_slots = max_size * vcpus
     pending_jobs = get_pending_jobs_info(max_slots_filter=max_cluster_slots, skip_if_state=SGE_HOLD_STATE)
     logging.info("Found the following pending jobs:\n%s", pending_jobs)
-    slots = 0
-    for job in pending_jobs:
-        slots += job.slots
-
-    return slots
+    return [job.slots for job in pending_jobs]
 
 
 # get nodes requested from pending jobs
 def get_required_nodes(instance_properties, max_size):
-    required_slots = _get_required_slots(instance_properties, max_size)
     vcpus = instance_properties.get("slots")
-    return -(-required_slots // vcpus)
+    # Jobs bigger than a node necessarily span multiple nodes: their whole nodes are requested as such and only the
+    # remaining slots are packed together with the other jobs. Jobs fitting in a node are packed as a whole: dividing
+    # the total slots by the node size underestimates the nodes when such jobs do not fit together on a node.
+    slots_requested = []
+    nodes_requested = []
+    for job_slots in _get_required_slots(vcpus, max_size):
+        full_nodes, remaining_slots = divmod(job_slots, vcpus)
+        if full_nodes:
+            nodes_requested.append(full_nodes)
+            slots_requested.append(full_nodes * vcpus)
+        if remaining_slots:
+            nodes_requested.append(1)
+            slots_requested.append(remaining_slots)
+
+    return get_optimal_nodes(nodes_requested, slots_requested, instance_properties)
 
 
 def get_busy_nodes():
@@ -49,11 +59,7 @@ def get_busy_nodes():
     for node in nodes.values():
         if SGE_DISABLED_STATE in node.state:
             continue
-        if (
-            any(busy_state in node.state for busy_state in SGE_BUSY_STATES)
-            or int(node.slots_used) > 0
-            or int(node.slots_reserved) > 0
-        ):
+        if not SGE_BUSY_STATES.isdisjoint(node.state) or node.slots_used > 0 or node.slots_reserved > 0:
             if SGE_ORPHANED_STATE in node.state:
                 logging.info(
                     "Skipping host %s since in orphaned state, hence not in ASG. "
@@ -8,23 +8,76 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import bisect
 import logging
 
 log = logging.getLogger(__name__)
 
 
+def _get_first_fit_nodes(jobs, vcpus):
+    """
+    Get the number of nodes required by the jobs when placed in queue order (First-Fit).
+
+    :param jobs: list of (slots required per node, number of nodes) tuples, in queue order
+    :param vcpus: number of slots available per node
+    :return: the number of nodes added
+    """
+    slots_remaining_per_node = []
+    for slots_required_per_node, num_of_nodes in jobs:
+        # Verify if there are enough available slots in the nodes allocated in the previous rounds
+        for slot_idx, slots_available in enumerate(slots_remaining_per_node):
+            if num_of_nodes > 0 and slots_available >= slots_required_per_node:
+                # The node represented by slot_idx can be used to run this job
+                slots_remaining_per_node[slot_idx] -= slots_required_per_node
+                num_of_nodes -= 1
+
+        # Since the number of available slots were unable to run this job entirely, only add the necessary nodes.
+        slots_remaining_per_node.extend([vcpus - slots_required_per_node] * num_of_nodes)
+
+    return len(slots_remaining_per_node)
+
+
+def _get_best_fit_decreasing_nodes(jobs, vcpus):
+    """
+    Get the number of nodes required by the jobs when placed in decreasing order of slots (Best-Fit Decreasing).
+
+    :param jobs: list of (slots required per node, number of nodes) tuples
+    :param vcpus: number of slots available per node
+    :return: the number of nodes added
+    """
+    # Sorted list of the slots remaining on each allocated node
+    slots_remaining_per_node = []
+    for slots_required_per_node, num_of_nodes in sorted(jobs, reverse=True):
+        # Verify if there are enough available slots in the nodes allocated in the previous rounds.
+        # The nodes of a job must be distinct, hence the job takes the num_of_nodes tightest nodes that fit.
+        fitting_start = bisect.bisect_left(slots_remaining_per_node, slots_required_per_node)
+        fitting_end = fitting_start + num_of_nodes
+        fitting_nodes = slots_remaining_per_node[fitting_start:fitting_end]
+        del slots_remaining_per_node[fitting_start:fitting_end]
+        num_of_nodes -= len(fitting_nodes)
+
+        # Since the number of available slots were unable to run this job entirely, only add the necessary nodes.
+        for slots_available in fitting_nodes + [vcpus] * num_of_nodes:
+            bisect.insort(slots_remaining_per_node, slots_available - slots_required_per_node)
+
+    return len(slots_remaining_per_node)
+
+
 def get_optimal_nodes(nodes_requested, slots_requested, instance_properties):
     """
     Get the optimal number of nodes required to satisfy the number of nodes and slots requested.
 
+    Jobs are placed both in decreasing order of slots required per node (Best-Fit Decreasing) and in queue order
+    (First-Fit), and the smaller number of nodes is returned. Best-Fit Decreasing usually leads to a tighter packing,
+    but being a heuristic it can require more nodes than the queue order for some multi-node jobs.
+
     :param nodes_requested: Array containing the number of nodes requested by the ith job
     :param slots_requested: Array containing the number of slots requested by the ith job
     :param instance_properties: instance properties, i.e. number of slots available per node
     :return: The optimal number of nodes required to satisfy the input queue.
     """
     vcpus = instance_properties.get("slots")
-    slots_remaining_per_node = []
-
+    jobs = []
     for slots, num_of_nodes in zip(slots_requested, nodes_requested):
         log.info("Requested %s nodes and %s slots" % (num_of_nodes, slots))
         # For simplicity, uniformly distribute the numbers of cpus requested across all the requested nodes
@@ -37,21 +90,11 @@ def get_optimal_nodes(nodes_requested, slots_requested, instance_properties):
                 vcpus,
             )
             continue
+        jobs.append((slots_required_per_node, num_of_nodes))
 
-        # Verify if there are enough available slots in the nodes allocated in the previous rounds
-        for slot_idx, slots_available in enumerate(slots_remaining_per_node):
-            if num_of_nodes > 0 and slots_available >= slots_required_per_node:
-                log.info("Slot available in existing node")
-                # The node represented by slot_idx can be used to run this job
-                slots_remaining_per_node[slot_idx] -= slots_required_per_node
-                num_of_nodes -= 1
-
-        log.info("After looking at already allocated nodes, %s more nodes are needed" % num_of_nodes)
-
-        # Since the number of available slots were unable to run this job entirely, only add the necessary nodes.
-        for _ in range(num_of_nodes):
-            log.info("Adding node. Using %s slots" % slots_required_per_node)
-            slots_remaining_per_node.append(vcpus - slots_required_per_node)
-
-    # return the number of nodes added
-    return len(slots_remaining_per_node)
+    best_fit_decreasing_nodes = _get_best_fit_decreasing_nodes(jobs, vcpus)
+    first_fit_nodes = _get_first_fit_nodes(jobs, vcpus)
+    log.info(
+        "Best-Fit Decreasing requires %s nodes, First-Fit requires %s nodes", best_fit_decreasing_nodes, first_fit_nodes
+    )
+    return min(best_fit_decreasing_nodes, first_fit_nodes)
@@ -85,7 +85,7 @@ def is_node_down():
 
         node = nodes.get(host_fqdn, nodes.get(hostname))
         log.info("Node is in state: '{0}'".format(node.state))
-        if all(error_state not in node.state for error_state in SGE_ERROR_STATES):
+        if SGE_ERROR_STATES.isdisjoint(node.state):
             return False
     except Exception as e:
         log.error("Failed when checking if node is down with exception %s. Reporting node as down.", e)
@@ -0,0 +1,84 @@
+# Copyright 2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+from assertpy import assert_that
+from common.schedulers.converters import ComparableObject
+from common.schedulers.sge_commands import SgeJob
+
+
+class DictObject(ComparableObject):
+    def __init__(self, name=None, slots=0):
+        self.name = name
+        self.slots = slots
+
+
+class ExtendedSgeJob(SgeJob):
+    def __init__(self, number=None, queue=None):
+        super(ExtendedSgeJob, self).__init__(number=number)
+        self.queue = queue
+
+
+class SlottedSgeJob(SgeJob):
+    __slots__ = ("queue",)
+
+    def __init__(self, number=None, queue=None):
+        super(SlottedSgeJob, self).__init__(number=number)
+        self.queue = queue
+
+
+@pytest.mark.parametrize(
+    "obj, other, expected_equal",
+    [
+        (DictObject("job", 1), DictObject("job", 1), True),
+        (DictObject("job", 1), DictObject("job", 2), False),
+        (ExtendedSgeJob("1", "all.q"), ExtendedSgeJob("1", "all.q"), True),
+        (ExtendedSgeJob("1", "all.q"), ExtendedSgeJob("1", "other.q"), False),
+        (ExtendedSgeJob("1", "all.q"), ExtendedSgeJob("2", "all.q"), False),
+        (SlottedSgeJob("1", "all.q"), SlottedSgeJob("1", "all.q"), True),
+        (SlottedSgeJob("1", "all.q"), SlottedSgeJob("1", "other.q"), False),
+        (SlottedSgeJob("1", "all.q"), SlottedSgeJob("2", "all.q"), False),
+    ],
+    ids=[
+        "dict_equal",
+        "dict_different",
+        "slots_and_dict_equal",
+        "dict_different_slots_equal",
+        "slots_different",
+        "inherited_slots_equal",
+        "own_slots_different",
+        "inherited_slots_different",
+    ],
+)
+def test_comparable_object_equality(obj, other, expected_equal):
+    assert_that(obj == other).is_equal_to(expected_equal)
+    assert_that(obj != other).is_equal_to(not expected_equal)
+
+
+@pytest.mark.parametrize(
+    "obj, expected_repr",
+    [
+        (DictObject("job", 1), "DictObject(name='job', slots=1)"),
+        (
+            ExtendedSgeJob("1", "all.q"),
+            "ExtendedSgeJob(number='1', slots=0, state='', node_type=None, array_index=None, hostname=None, "
+            "queue='all.q')",
+        ),
+        (
+            SlottedSgeJob("1", "all.q"),
+            "SlottedSgeJob(number='1', slots=0, state='', node_type=None, array_index=None, hostname=None, "
+            "queue='all.q')",
+        ),
+    ],
+    ids=["dict", "slots_and_dict", "inherited_slots"],
+)
+def test_comparable_object_repr(obj, expected_repr):
+    assert_that(repr(obj)).is_equal_to(expected_repr)
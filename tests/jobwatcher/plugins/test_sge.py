@@ -162,11 +162,29 @@ def test_get_busy_nodes(cluster_nodes, expected_busy_nodes, mocker):
             14,
         ),
         ([], 0),
+        (
+            [
+                SgeJob(number="89", slots=3, state="qw"),
+                SgeJob(number="90", slots=3, state="qw"),
+                SgeJob(number="91", slots=3, state="qw"),
+                SgeJob(number="92", slots=3, state="qw"),
+            ],
+            4,
+        ),
+        (
+            [
+                SgeJob(number="89", slots=6, state="qw"),
+                SgeJob(number="90", slots=3, state="qw"),
+                SgeJob(number="91", slots=2, state="qw"),
+            ],
+            3,
+        ),
     ],
-    ids=["single_job", "multiple_jobs", "no_jobs"],
+    ids=["single_job", "multiple_jobs", "no_jobs", "jobs_not_sharing_nodes", "job_spanning_multiple_nodes"],
 )
 def test_get_required_nodes(pending_jobs, expected_required_nodes, mocker):
     mock = mocker.patch("jobwatcher.plugins.sge.get_pending_jobs_info", return_value=pending_jobs, autospec=True)
+    nodes_mock = mocker.patch("jobwatcher.plugins.sge.get_compute_nodes_info", autospec=True)
 
     instance_properties = {"slots": 4}
     max_cluster_size = 10
@@ -175,3 +193,5 @@ def test_get_required_nodes(pending_jobs, expected_required_nodes, mocker):
     mock.assert_called_with(
         max_slots_filter=max_cluster_size * instance_properties["slots"], skip_if_state=SGE_HOLD_STATE
     )
+    # compute nodes are queried once per iteration, by get_busy_nodes only
+    nodes_mock.assert_not_called()
@@ -36,6 +36,17 @@ class OptimalNodeCountTests(unittest.TestCase):
         expected = 6
         self.assertEqual(nodes, expected)
 
+    def test_jobs_placed_by_decreasing_slots(self):
+        nodes = utils.get_optimal_nodes([1, 1, 1, 1], [2, 2, 6, 6], instance_properties)
+        expected = 2
+        self.assertEqual(nodes, expected)
+
+    def test_jobs_placed_in_queue_order(self):
+        # Best-Fit Decreasing alone would require 5 nodes for this queue
+        nodes = utils.get_optimal_nodes([3, 1, 1, 2, 2, 2], [6, 4, 7, 1, 2, 8], instance_properties)
+        expected = 4
+        self.assertEqual(nodes, expected)
+
 
 if __name__ == "__main__":
     unittest.main()